@@ -4,10 +4,62 @@ Handles vault creation, switching, configuration management, and first-time setu
 """
 
 import os
-import sys
 import json
 from pathlib import Path
 
+from .terminal import cbreak_mode, cooked_mode, read_key, write_frame
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_config(config):
+    """
+    Serialize a configuration dict to indented JSON bytes.
+    
+    Uses orjson when it is installed and falls back to the stdlib json module.
+    
+    Args:
+        config (dict): Configuration to serialize
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
+
+def _loads_config(data):
+    """
+    Parse JSON bytes into a configuration dict.
+    
+    Args:
+        data (bytes): UTF-8 encoded JSON
+        
+    Returns:
+        dict: Parsed configuration
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_config_file(config_path):
+    """
+    Read and parse a configuration file.
+    
+    Args:
+        config_path (Path): Path of the config file
+        
+    Returns:
+        dict: Parsed configuration
+    """
+    with open(config_path, 'rb') as f:
+        return _loads_config(f.read())
+
 
 class Settings:
     """
@@ -15,6 +67,41 @@ class Settings:
     Handles first-time setup, vault switching, and configuration persistence.
     """
     
+    # Vault subdirectories, relative to the vault root
+    VAULT_SUBDIRS = ('Pomodoro', 'Habits', 'Tasks', 'Templates', os.path.join('Templates', 'Habits'))
+    
+    MENU_ITEMS = (
+        "Create New Vault",
+        "Switch Vault",
+        "Change Vault Location",
+        "Set Pomodoro Focus Time",
+        "Set Pomodoro Break Time",
+        "Reset to Defaults"
+    )
+    
+    # Config keys mapped to the names returned by get_pomodoro_settings
+    POMODORO_KEYS = {
+        'pomodoro_focus': 'focus_time',
+        'pomodoro_break': 'break_time',
+        'long_break': 'long_break',
+        'cycles_before_long_break': 'cycles_before_long_break'
+    }
+    
+    # Static parts of the settings menu frame, padded once up front
+    _MENU_HEADER = (
+        "\033[32m",  # Green tint
+        "╭─────────────────────────────────────╮",
+        "│              ⚙️ Settings              │",
+        "├─────────────────────────────────────┤",
+    )
+    _MENU_ROWS = tuple(f"{item:<32} │" for item in MENU_ITEMS)
+    _MENU_FOOTER = (
+        "├─────────────────────────────────────┤",
+        "│ ↑↓: Navigate  Enter: Select  Esc: Back │",
+        "╰─────────────────────────────────────╯",
+        "\033[0m",
+    )
+    
     def __init__(self):
         """Initialize Settings module."""
         self.config_filename = ".bamboo_config.json"
@@ -27,75 +114,49 @@ class Settings:
             "cycles_before_long_break": 4
         }
         self.current_config = None
+        self._pomodoro_settings = None  # Cleared whenever the config changes
         self.running = True
         self.current_selection = 0
 
     def run(self):
         """Main Settings module loop."""
-        while self.running:
-            self.display_menu()
-            self.handle_input()
+        with cbreak_mode():
+            while self.running:
+                self.display_menu()
+                self.handle_input()
 
     def display_menu(self):
         """Display settings main menu."""
-        os.system('clear')
-        print("\033[32m")  # Green tint
-        print("╭─────────────────────────────────────╮")
-        print("│              ⚙️ Settings              │")
-        print("├─────────────────────────────────────┤")
-        
         config = self.load_config()
         vault_name = config.get('vault_name', 'No vault')
         vault_path = config.get('vault_path', 'Not set')
         
-        print(f"│ Current Vault: {vault_name[:20]:<20}     │")
-        print(f"│ Path: {vault_path[:30]:<30}   │")
-        print("├─────────────────────────────────────┤")
-        
-        menu_items = [
-            "Create New Vault",
-            "Switch Vault",
-            "Change Vault Location", 
-            "Set Pomodoro Focus Time",
-            "Set Pomodoro Break Time",
-            "Reset to Defaults"
-        ]
+        lines = list(self._MENU_HEADER)
+        lines.append(f"│ Current Vault: {vault_name[:20]:<20}     │")
+        lines.append(f"│ Path: {vault_path[:30]:<30}   │")
+        lines.append("├─────────────────────────────────────┤")
         
-        for i, item in enumerate(menu_items):
-            prefix = "► " if i == self.current_selection else "  "
-            print(f"│ {prefix}{item:<32} │")
+        for i, row in enumerate(self._MENU_ROWS):
+            prefix = "│ ► " if i == self.current_selection else "│   "
+            lines.append(prefix + row)
         
-        print("├─────────────────────────────────────┤")
-        print("│ ↑↓: Navigate  Enter: Select  Esc: Back │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        lines.extend(self._MENU_FOOTER)
+        write_frame(lines)
 
     def handle_input(self):
         """Handle keyboard input for settings navigation."""
-        import termios
-        import tty
-        
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.cbreak(fd)
-            key = sys.stdin.read(1)
-            
-            if key == '\x1b':  # Escape sequence
-                key += sys.stdin.read(2)
-                if key == '\x1b[A':  # Up arrow
-                    self.current_selection = (self.current_selection - 1) % 6
-                elif key == '\x1b[B':  # Down arrow
-                    self.current_selection = (self.current_selection + 1) % 6
-                elif key == '\x1b':  # Esc alone
-                    self.running = False
-            elif key == '\r' or key == '\n':  # Enter
-                self._handle_menu_selection()
-            elif key == '\x03':  # Ctrl+C
-                self.running = False
-                
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        key = read_key()
+        
+        if key == '\x1b[A':  # Up arrow
+            self.current_selection = (self.current_selection - 1) % len(self.MENU_ITEMS)
+        elif key == '\x1b[B':  # Down arrow
+            self.current_selection = (self.current_selection + 1) % len(self.MENU_ITEMS)
+        elif key == '\x1b':  # Esc alone
+            self.running = False
+        elif key == '\r' or key == '\n':  # Enter
+            self._handle_menu_selection()
+        elif key == '\x03':  # Ctrl+C
+            self.running = False
 
     def _handle_menu_selection(self):
         """Handle menu selection based on current_selection."""
@@ -114,17 +175,18 @@ class Settings:
 
     def _create_new_vault_dialog(self):
         """Dialog for creating a new vault."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│           Create New Vault          │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print("│ This will create a new vault and    │")
-        print("│ switch to it immediately.           │")
-        print("│                                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│           Create New Vault          │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            "│ This will create a new vault and    │",
+            "│ switch to it immediately.           │",
+            "│                                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         vault_name = self._get_user_input("Enter vault name", "NewVault")
         if not vault_name:
@@ -145,18 +207,19 @@ class Settings:
 
     def _switch_vault_dialog(self):
         """Dialog for switching to existing vault."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│             Switch Vault            │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print("│ Enter path to existing vault or     │")
-        print("│ path where new vault should be      │")
-        print("│ created.                            │")
-        print("│                                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│             Switch Vault            │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            "│ Enter path to existing vault or     │",
+            "│ path where new vault should be      │",
+            "│ created.                            │",
+            "│                                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         current_path = self.get_vault_path() or str(Path.home())
         vault_path = self._get_user_input("Enter vault path", current_path)
@@ -178,16 +241,17 @@ class Settings:
 
     def _set_focus_time_dialog(self):
         """Dialog for setting Pomodoro focus time."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│        Set Focus Time               │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print("│ Enter focus time in minutes         │")
-        print("│                                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│        Set Focus Time               │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            "│ Enter focus time in minutes         │",
+            "│                                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         current_time = self.get_pomodoro_settings()['focus_time']
         time_str = self._get_user_input("Focus time (minutes)", str(current_time))
@@ -207,16 +271,17 @@ class Settings:
 
     def _set_break_time_dialog(self):
         """Dialog for setting Pomodoro break time."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│         Set Break Time              │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print("│ Enter break time in minutes         │")
-        print("│                                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│         Set Break Time              │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            "│ Enter break time in minutes         │",
+            "│                                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         current_time = self.get_pomodoro_settings()['break_time']
         time_str = self._get_user_input("Break time (minutes)", str(current_time))
@@ -236,19 +301,20 @@ class Settings:
 
     def _reset_defaults_dialog(self):
         """Dialog for resetting to default settings."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│         Reset to Defaults           │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print("│ This will reset Pomodoro times to   │")
-        print("│ defaults. Vault path will remain    │")
-        print("│ unchanged.                          │")
-        print("│                                     │")
-        print("│ Continue? (y/N)                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│         Reset to Defaults           │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            "│ This will reset Pomodoro times to   │",
+            "│ defaults. Vault path will remain    │",
+            "│ unchanged.                          │",
+            "│                                     │",
+            "│ Continue? (y/N)                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         key = self._get_single_key()
         if key.lower() == 'y':
@@ -276,34 +342,33 @@ class Settings:
         for config_path in possible_configs:
             if config_path.exists():
                 try:
-                    with open(config_path, 'r') as f:
-                        config = json.load(f)
-                        if config.get('vault_path') and Path(config['vault_path']).exists():
-                            return False
-                except (json.JSONDecodeError, KeyError):
+                    # A full parse, so a config load_config() can't read
+                    # isn't taken as a configured vault
+                    config = _read_config_file(config_path)
+                    if config.get('vault_path') and Path(config['vault_path']).exists():
+                        return False
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError, AttributeError):
                     continue
         
         return True
 
     def first_time_setup(self):
         """Guide user through first-time vault setup."""
-        import termios
-        import tty
-        
-        os.system('clear')
-        print("\033[32m")  # Green tint
-        print("╭─────────────────────────────────────╮")
-        print("│        🎋 Bamboo Productivity        │")
-        print("│          First Time Setup           │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print("│ Welcome! Let's set up your vault.   │")
-        print("│                                     │")
-        print("│ Your vault will store all your      │")
-        print("│ habits, tasks, and Pomodoro data.   │")
-        print("│                                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",  # Green tint
+            "╭─────────────────────────────────────╮",
+            "│        🎋 Bamboo Productivity        │",
+            "│          First Time Setup           │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            "│ Welcome! Let's set up your vault.   │",
+            "│                                     │",
+            "│ Your vault will store all your      │",
+            "│ habits, tasks, and Pomodoro data.   │",
+            "│                                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         # Get vault name
         vault_name = self._get_user_input("Enter vault name", "BambooVault")
@@ -326,17 +391,18 @@ class Settings:
         
         # Create vault
         if self.create_vault(vault_name, vault_path):
-            os.system('clear')
-            print("\033[32m")
-            print("╭─────────────────────────────────────╮")
-            print("│          ✅ Setup Complete!          │")
-            print("├─────────────────────────────────────┤")
-            print(f"│ Vault: {vault_name:<26} │")
-            print(f"│ Path:  {vault_path[:26]:<26} │")
-            print("│                                     │")
-            print("│ Press any key to continue...        │")
-            print("╰─────────────────────────────────────╯")
-            print("\033[0m")
+            write_frame([
+                "\033[32m",
+                "╭─────────────────────────────────────╮",
+                "│          ✅ Setup Complete!          │",
+                "├─────────────────────────────────────┤",
+                f"│ Vault: {vault_name:<26} │",
+                f"│ Path:  {vault_path[:26]:<26} │",
+                "│                                     │",
+                "│ Press any key to continue...        │",
+                "╰─────────────────────────────────────╯",
+                "\033[0m",
+            ])
             self._get_single_key()
             return True
         else:
@@ -363,15 +429,11 @@ class Settings:
         
         try:
             vault_dir = Path(vault_path)
-            vault_dir.mkdir(parents=True, exist_ok=True)
             
-            # Create subdirectories
-            subdirs = ['Pomodoro', 'Habits', 'Tasks', 'Templates']
-            for subdir in subdirs:
-                (vault_dir / subdir).mkdir(exist_ok=True)
-            
-            # Create Templates/Habits subdirectory
-            (vault_dir / 'Templates' / 'Habits').mkdir(parents=True, exist_ok=True)
+            # Create the vault and its subdirectories in one pass
+            root = os.fspath(vault_dir)
+            for subdir in self.VAULT_SUBDIRS:
+                os.makedirs(os.path.join(root, subdir), exist_ok=True)
             
             # Create config file in vault
             config = self.default_config.copy()
@@ -408,10 +470,9 @@ class Settings:
         config_path = vault_dir / self.config_filename
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    self.current_config = config
-                    return True
+                self.current_config = _read_config_file(config_path)
+                self._pomodoro_settings = None
+                return True
             except (json.JSONDecodeError, IOError):
                 pass
         
@@ -444,10 +505,9 @@ class Settings:
         for config_path in possible_configs:
             if config_path.exists():
                 try:
-                    with open(config_path, 'r') as f:
-                        config = json.load(f)
-                        self.current_config = config
-                        return config
+                    config = _read_config_file(config_path)
+                    self.current_config = config
+                    return config
                 except (json.JSONDecodeError, IOError):
                     continue
         
@@ -472,12 +532,23 @@ class Settings:
                 vault_dir = Path.home()
         
         config_path = Path(vault_dir) / self.config_filename
+        tmp_path = config_path.with_suffix('.json.tmp')
         
         try:
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write to a temp file and swap it in, so a crash mid-write
+            # never leaves a truncated config behind
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps_config(config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, config_path)
             self.current_config = config
+            self._pomodoro_settings = None
         except (IOError, PermissionError) as e:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             print(f"Error saving config: {e}")
 
     def get_vault_path(self):
@@ -497,9 +568,7 @@ class Settings:
         Args:
             minutes (int): Focus time in minutes
         """
-        config = self.load_config()
-        config['pomodoro_focus'] = minutes
-        self.save_config(config)
+        self._update('pomodoro_focus', minutes)
 
     def set_pomodoro_break_time(self, minutes):
         """
@@ -508,8 +577,20 @@ class Settings:
         Args:
             minutes (int): Break time in minutes
         """
-        config = self.load_config()
-        config['pomodoro_break'] = minutes
+        self._update('pomodoro_break', minutes)
+
+    def _update(self, key, value):
+        """
+        Set a single configuration value and persist it.
+        
+        Mutates the cached config in place, so only the write touches disk.
+        
+        Args:
+            key (str): Configuration key
+            value: New value for the key
+        """
+        config = self.current_config or self.load_config()
+        config[key] = value
         self.save_config(config)
 
     def get_pomodoro_settings(self):
@@ -519,13 +600,12 @@ class Settings:
         Returns:
             dict: Pomodoro settings (focus_time, break_time, etc.)
         """
-        config = self.load_config()
-        return {
-            'focus_time': config.get('pomodoro_focus', 25),
-            'break_time': config.get('pomodoro_break', 5),
-            'long_break': config.get('long_break', 15),
-            'cycles_before_long_break': config.get('cycles_before_long_break', 4)
-        }
+        if self._pomodoro_settings is None:
+            config = {**self.default_config, **self.load_config()}
+            self._pomodoro_settings = {
+                name: config[key] for key, name in self.POMODORO_KEYS.items()
+            }
+        return dict(self._pomodoro_settings)
 
     def reset_to_defaults(self):
         """Reset configuration to default values."""
@@ -581,20 +661,13 @@ class Settings:
         print(f"\n{prompt} [{default_value}]: ", end="", flush=True)
         
         try:
-            user_input = input().strip()
+            with cooked_mode():
+                user_input = input().strip()
             return user_input if user_input else default_value
         except (KeyboardInterrupt, EOFError):
             return None
 
     def _get_single_key(self):
         """Get a single keypress from user."""
-        import termios
-        import tty
-        
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.cbreak(fd)
-            return sys.stdin.read(1)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
\ No newline at end of file
+        with cbreak_mode():
+            return read_key()
\ No newline at end of file
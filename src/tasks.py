@@ -4,11 +4,45 @@ Handles task management with subtasks, completion tracking, and markdown storage
 """
 
 import os
+import re
 import sys
 import time
+import queue
+import shutil
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from .settings import Settings
+from .terminal import cbreak_mode, cooked_mode, read_key, write_frame
+
+# Number of task files whose parsed tasks are kept in memory
+TASK_CACHE_SIZE = 64
+
+# Seconds the background writer waits so rapid edits end up in one save
+SAVE_COALESCE_DELAY = 0.2
+
+# Markdown task line after its indentation: "- [?]" checkbox, task text; any
+# state other than x/X ("[-]", "[/]", ...) is read as not completed
+_TASK_RE = re.compile(r'- \[([^\]]?)\](.*)')
+
+# Name of a per-day task file, see create_task_filename()
+_TASK_FILE_RE = re.compile(r'Task_\d{4}-\d{2}-\d{2}\.md')
+
+# Deepest indent level read from a file; levels are kept in a bytearray
+_MAX_PARSED_INDENT = 255
+
+# Markdown checkbox indexed by a task's completed flag
+_CHECKBOXES = ("[ ]", "[x]")
+
+# Screen row of the first task line in the view frame (rows are 1-based,
+# the colour line and six header lines come first)
+_VIEW_TASK_ROW = 9
+
+# Columns taken by the frame's box; a narrower terminal wraps its lines
+_FRAME_WIDTH = 39
+
 
 class Tasks:
     """
@@ -16,32 +50,147 @@ class Tasks:
     Supports creating, editing, and organizing tasks with completion tracking.
     """
     
+    # Static frame pieces, built once instead of on every redraw
+    _SEPARATOR = "├─────────────────────────────────────┤"
+    _DATE_LINE = "│ Date: %s (%s)     │"
+    _VIEW_HEADER = (
+        "\033[32m",  # Green tint
+        "╭─────────────────────────────────────╮",
+        "│           ✅ Task Manager            │",
+        _SEPARATOR,
+    )
+    _VIEW_EMPTY = (
+        "│                                     │",
+        "│  No tasks for this date.            │",
+        "│  Press E to start editing.          │",
+        "│                                     │",
+    )
+    _VIEW_COUNT_LINE = "│ Tasks: %d/%d completed              │"
+    _VIEW_FOOTER = (
+        _SEPARATOR,
+        "│ E: Edit  Space: Toggle  D: Jump date│",
+        "│ R: Today  N: Prev day  M: Next day  │",
+        "│ Esc: Back to dashboard              │",
+        "╰─────────────────────────────────────╯",
+        "\033[0m",
+    )
+    _EDIT_HEADER = (
+        "\033[32m",  # Green tint
+        "╭─────────────────────────────────────╮",
+        "│         ✏️  Task Editor              │",
+        _SEPARATOR,
+    )
+    _EDIT_EMPTY = (
+        "│                                     │",
+        "│  No tasks yet.                     │",
+        "│  Press Ctrl+Enter to add first task│",
+        "│                                     │",
+    )
+    _EDIT_FOOTER = (
+        _SEPARATOR,
+        "│ Ctrl+Enter: New task  Space: Toggle │",
+        "│ Tab: Indent  Shift+Tab: Unindent    │",
+        "│ Enter: Edit text  Del: Delete       │",
+        "│ Ctrl+S: Save  Esc: View mode        │",
+        "╰─────────────────────────────────────╯",
+        "\033[0m",
+    )
+    
     def __init__(self):
         """Initialize Tasks module."""
         # Load settings and vault path
-        from .settings import Settings
         self.settings = Settings()
         
-        self.current_date = datetime.now().date()
-        self.tasks = []
+        # Resolved to today on first access, see the current_date property
+        self._current_date = None
+        self._date_str = None
         self.current_selection = 0
         self.running = True
         self.edit_mode = False
         self.cursor_pos = 0  # For text editing
         
-        # Task structure: {'text': str, 'completed': bool, 'indent_level': int}
-        self.tasks = []
+        # View frame state: full repaint needed, selection shown on screen,
+        # last frame drawn fits the terminal without wrapping or scrolling
+        self._frame_dirty = True
+        self._last_selection = -1
+        self._frame_fits = False
+        
+        # Day labels by (date, today); only grows with the dates viewed
+        self._day_name_cache = {}
+        
+        # Formatted task rows after the selection marker, by task index;
+        # entries are dropped whenever the task they show changes
+        self._view_line_cache = {}
+        self._edit_line_cache = {}
+        
+        # Tasks are stored as parallel arrays indexed by task position
+        self.texts = []
+        self.completed = bytearray()
+        self.indent_levels = bytearray()
+        
+        # Parsed task files by path as (mtime_ns, texts, completed, indent_levels),
+        # least recently used first
+        self._task_cache = OrderedDict()
+        
+        # Tasks directory already created (or found) this session
+        self._created_tasks_dir = None
+        
+        # Names of the task files in _task_files_dir, listed once per session
+        self._task_files = None
+        self._task_files_dir = None
+        
+        # Vault path, read from the config once per visit (the dashboard
+        # creates a new Tasks for each one, so a vault switch is seen next time)
+        self._vault_path_cache = None
+        
+        # Saves waiting for the background writer, latest snapshot per task
+        # file path as (tasks_dir, filename, content, tasks). The lock guards
+        # these and the caches above, which the writer thread also updates.
+        # Write errors are kept in _save_error for the UI thread to show.
+        self._pending_saves = {}
+        self._save_lock = threading.Lock()
+        self._save_queue = queue.Queue()
+        self._save_thread = None
+        self._save_error = None
+
+    @property
+    def current_date(self):
+        """datetime.date: Date being viewed, today unless changed."""
+        if self._current_date is None:
+            self._set_date(datetime.now().date())
+        return self._current_date
+
+    @current_date.setter
+    def current_date(self, date):
+        self._set_date(date)
+
+    @property
+    def current_date_str(self):
+        """str: ISO formatted current date, cached alongside it."""
+        if self._current_date is None:
+            self._set_date(datetime.now().date())
+        return self._date_str
 
     def run(self):
         """Main Tasks module loop."""
         self.load_tasks()
-        while self.running:
-            if self.edit_mode:
-                self.display_edit_view()
-                self.handle_edit_input()
-            else:
-                self.display_view_mode()
-                self.handle_view_input()
+        try:
+            with cbreak_mode():
+                while self.running:
+                    self._report_save_error()
+                    if self.edit_mode:
+                        self.display_edit_view()
+                        self.handle_edit_input()
+                        self._frame_dirty = True
+                    else:
+                        if self._frame_dirty:
+                            self.display_view_mode()
+                        self.handle_view_input()
+        finally:
+            self.flush_saves()
+            self._stop_save_worker()
+            if self._save_error:
+                print(self._save_error)
 
     def display_menu(self):
         """Display tasks main menu (alias for display_view_mode)."""
@@ -49,54 +198,149 @@ class Tasks:
 
     def display_view_mode(self):
         """Display tasks in view mode."""
-        os.system('clear')
-        print("\033[32m")  # Green tint
-        print("╭─────────────────────────────────────╮")
-        print("│           ✅ Task Manager            │")
-        print("├─────────────────────────────────────┤")
-        print(f"│ Date: {self.current_date.strftime('%Y-%m-%d')} ({self._get_day_name()})     │")
-        print("├─────────────────────────────────────┤")
-        
-        if not self.tasks:
-            print("│                                     │")
-            print("│  No tasks for this date.            │")
-            print("│  Press E to start editing.          │")
-            print("│                                     │")
+        lines = list(self._VIEW_HEADER)
+        lines.append(self._DATE_LINE % (self.current_date_str, self._get_day_name()))
+        lines.append(self._SEPARATOR)
+        
+        if not self.texts:
+            lines.extend(self._VIEW_EMPTY)
         else:
             # Show task count
-            completed_count = sum(1 for task in self.tasks if task.get('completed', False))
-            total_count = len(self.tasks)
-            print(f"│ Tasks: {completed_count}/{total_count} completed              │")
-            print("├─────────────────────────────────────┤")
+            completed_count = self.completed.count(1)
+            total_count = len(self.texts)
+            lines.append(self._VIEW_COUNT_LINE % (completed_count, total_count))
+            lines.append(self._SEPARATOR)
             
             # Display tasks (show up to 8 tasks to fit in terminal)
-            display_tasks = self.tasks[:8] if len(self.tasks) > 8 else self.tasks
-            for i, task in enumerate(display_tasks):
-                prefix = "► " if i == self.current_selection else "  "
-                status = "✓" if task.get('completed', False) else "○"
-                indent = "  " * task.get('indent_level', 0)
-                task_text = task.get('text', '')
-                
-                # Adjust text length based on indentation
-                max_text_len = 30 - len(indent)
-                if len(task_text) > max_text_len:
-                    task_text = task_text[:max_text_len-3] + "..."
-                
-                print(f"│{prefix}{status} {indent}{task_text:<{30-len(indent)}} │")
+            for i in range(min(total_count, 8)):
+                lines.append(self._view_task_line(i, i == self.current_selection))
             
-            if len(self.tasks) > 8:
-                print(f"│  ... and {len(self.tasks) - 8} more tasks          │")
+            if total_count > 8:
+                lines.append(f"│  ... and {total_count - 8} more tasks          │")
+        
+        lines.extend(self._VIEW_FOOTER)
+        write_frame(lines)
+        self._frame_dirty = False
+        self._last_selection = self.current_selection
+        
+        # Checked once per frame; the frame ends with a newline, so it needs
+        # one row more than its lines
+        size = shutil.get_terminal_size()
+        self._frame_fits = len(lines) < size.lines and size.columns >= _FRAME_WIDTH
+
+    def _view_task_line(self, index, selected):
+        """
+        Format one task row of the view frame.
         
-        print("├─────────────────────────────────────┤")
-        print("│ E: Edit  Space: Toggle  D: Jump date│")
-        print("│ R: Today  N: Prev day  M: Next day  │")
-        print("│ Esc: Back to dashboard              │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        Args:
+            index (int): Task index
+            selected (bool): Whether to draw the selection marker
+            
+        Returns:
+            str: Boxed task line
+        """
+        line = self._view_line_cache.get(index)
+        if line is None:
+            status = "✓" if self.completed[index] else "○"
+            indent = "  " * self.indent_levels[index]
+            task_text = self.texts[index]
+            
+            # Adjust text length based on indentation
+            max_text_len = 30 - len(indent)
+            if len(task_text) > max_text_len:
+                task_text = task_text[:max_text_len-3] + "..."
+            
+            line = self._view_line_cache[index] = f"{status} {indent}{task_text:<{30-len(indent)}} │"
+        
+        return ("│► " if selected else "│  ") + line
+
+    def _edit_task_line(self, index, selected):
+        """
+        Format one task row of the edit view.
+        
+        Args:
+            index (int): Task index
+            selected (bool): Whether to draw the selection marker
+            
+        Returns:
+            str: Boxed task line in markdown form
+        """
+        line = self._edit_line_cache.get(index)
+        if line is None:
+            status = "[x]" if self.completed[index] else "[ ]"
+            indent = "    " * self.indent_levels[index]  # 4 spaces per indent level
+            task_text = self.texts[index]
+            
+            # Truncate long task text to fit display
+            max_text_len = 25 - len(indent)
+            if len(task_text) > max_text_len:
+                task_text = task_text[:max_text_len-3] + "..."
+            
+            line = self._edit_line_cache[index] = f"- {status} {indent}{task_text:<{25-len(indent)}} │"
+        
+        return ("│► " if selected else "│  ") + line
+
+    def _invalidate_lines(self, index=None):
+        """
+        Drop cached task rows after the tasks changed.
+        
+        Args:
+            index (int): Task whose row changed, or None when tasks were
+                loaded, inserted or removed
+        """
+        if index is None:
+            self._view_line_cache.clear()
+            self._edit_line_cache.clear()
+        else:
+            self._view_line_cache.pop(index, None)
+            self._edit_line_cache.pop(index, None)
+
+    def _render_selection_delta(self, old, new):
+        """
+        Move the selection marker by redrawing only the two affected rows.
+        
+        Falls back to a full repaint on the next loop pass when either row
+        is outside the visible task window, or when the frame didn't fit the
+        terminal (it scrolled or wrapped, so its rows aren't where they were drawn).
+        
+        Args:
+            old (int): Previously selected task index
+            new (int): Newly selected task index
+        """
+        if (self._frame_dirty or not self._frame_fits
+                or old != self._last_selection or max(old, new) >= 8):
+            self._frame_dirty = True
+            return
+        
+        # Save cursor, repaint both rows in the frame colour, restore cursor
+        parts = ["\x1b7\033[32m"]
+        for index, selected in ((old, False), (new, True)):
+            parts.append(f"\x1b[{_VIEW_TASK_ROW + index};1H")
+            parts.append(self._view_task_line(index, selected))
+        parts.append("\033[0m\x1b8")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
+        self._last_selection = new
 
     def _get_day_name(self):
         """Get the day name for current date."""
         today = datetime.now().date()
+        key = (self.current_date, today)
+        name = self._day_name_cache.get(key)
+        if name is None:
+            name = self._day_name_cache[key] = self._compute_day_name(today)
+        return name
+
+    def _compute_day_name(self, today):
+        """
+        Work out the day label for the current date.
+        
+        Args:
+            today (datetime.date): Today's date
+            
+        Returns:
+            str: "Today", "Yesterday", "Tomorrow" or the weekday name
+        """
         if self.current_date == today:
             return "Today"
         elif self.current_date == today - timedelta(days=1):
@@ -108,183 +352,211 @@ class Tasks:
 
     def display_edit_view(self):
         """Display tasks in edit mode."""
-        os.system('clear')
-        print("\033[32m")  # Green tint
-        print("╭─────────────────────────────────────╮")
-        print("│         ✏️  Task Editor              │")
-        print("├─────────────────────────────────────┤")
-        print(f"│ Date: {self.current_date.strftime('%Y-%m-%d')} ({self._get_day_name()})     │")
-        print("├─────────────────────────────────────┤")
-        
-        if not self.tasks:
-            print("│                                     │")
-            print("│  No tasks yet.                     │")
-            print("│  Press Ctrl+Enter to add first task│")
-            print("│                                     │")
+        lines = list(self._EDIT_HEADER)
+        lines.append(self._DATE_LINE % (self.current_date_str, self._get_day_name()))
+        lines.append(self._SEPARATOR)
+        
+        if not self.texts:
+            lines.extend(self._EDIT_EMPTY)
         else:
             # Display tasks in markdown format
-            for i, task in enumerate(self.tasks):
-                prefix = "► " if i == self.current_selection else "  "
-                status = "[x]" if task.get('completed', False) else "[ ]"
-                indent = "    " * task.get('indent_level', 0)  # 4 spaces per indent level
-                task_text = task.get('text', '')
-                
-                # Truncate long task text to fit display
-                max_text_len = 25 - len(indent)
-                if len(task_text) > max_text_len:
-                    task_text = task_text[:max_text_len-3] + "..."
-                
-                print(f"│{prefix}- {status} {indent}{task_text:<{25-len(indent)}} │")
-        
-        print("├─────────────────────────────────────┤")
-        print("│ Ctrl+Enter: New task  Space: Toggle │")
-        print("│ Tab: Indent  Shift+Tab: Unindent    │")
-        print("│ Enter: Edit text  Del: Delete       │")
-        print("│ Ctrl+S: Save  Esc: View mode        │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+            for i in range(len(self.texts)):
+                lines.append(self._edit_task_line(i, i == self.current_selection))
+        
+        lines.extend(self._EDIT_FOOTER)
+        write_frame(lines)
 
     def handle_view_input(self):
         """Handle keyboard input in view mode."""
-        import termios
-        import tty
+        self._dispatch_view_key(read_key())
+
+    def _dispatch_view_key(self, key):
+        """
+        Apply one view mode keypress.
         
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.cbreak(fd)
-            key = sys.stdin.read(1)
-            
-            if key == '\x1b':  # Escape sequence or single escape
-                try:
-                    key += sys.stdin.read(2)
-                    if key == '\x1b[A':  # Up arrow
-                        if self.tasks:
-                            self.current_selection = (self.current_selection - 1) % len(self.tasks)
-                    elif key == '\x1b[B':  # Down arrow
-                        if self.tasks:
-                            self.current_selection = (self.current_selection + 1) % len(self.tasks)
-                except:
-                    # Single Esc - go back
-                    self.running = False
-            elif key == ' ':  # Space - toggle task completion
-                if self.tasks and 0 <= self.current_selection < len(self.tasks):
-                    self.toggle_task_completion(self.current_selection)
-                    self.save_tasks()
-            elif key.lower() == 'e':  # Enter edit mode
-                self.edit_mode = True
-            elif key.lower() == 'd':  # Jump to date
-                self._jump_to_date()
-            elif key.lower() == 'r':  # Return to today
-                self.current_date = datetime.now().date()
-                self.current_selection = 0
-                self.load_tasks()
-            elif key.lower() == 'n':  # Previous day
-                self.current_date -= timedelta(days=1)
-                self.current_selection = 0
-                self.load_tasks()
-            elif key.lower() == 'm':  # Next day
-                self.current_date += timedelta(days=1)
-                self.current_selection = 0
-                self.load_tasks()
-            elif key == '\x03':  # Ctrl+C
-                self.running = False
-                
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        Args:
+            key (str): Key as returned by read_key()
+        """
+        old_selection = self.current_selection
+        
+        if key == '\x1b[A':  # Up arrow
+            if self.texts:
+                self.current_selection = (self.current_selection - 1) % len(self.texts)
+                self._render_selection_delta(old_selection, self.current_selection)
+        elif key == '\x1b[B':  # Down arrow
+            if self.texts:
+                self.current_selection = (self.current_selection + 1) % len(self.texts)
+                self._render_selection_delta(old_selection, self.current_selection)
+        elif key == '\x1b':  # Single Esc - go back
+            self.running = False
+        elif key.startswith('\x1b'):  # Other escape sequences are ignored
+            pass
+        elif key == ' ':  # Space - toggle task completion
+            if self.texts and 0 <= self.current_selection < len(self.texts):
+                self.toggle_task_completion(self.current_selection)
+                self.save_tasks()
+                self._frame_dirty = True
+        elif key.lower() == 'e':  # Enter edit mode
+            self.edit_mode = True
+        elif key.lower() == 'd':  # Jump to date
+            self._jump_to_date()
+            self._frame_dirty = True
+        elif key.lower() == 'r':  # Return to today
+            self._set_date(datetime.now().date())
+            self.current_selection = 0
+            self.load_tasks()
+            self._frame_dirty = True
+        elif key.lower() == 'n':  # Previous day
+            self.navigate_date('prev')
+            self.current_selection = 0
+            self.load_tasks()
+            self._frame_dirty = True
+        elif key.lower() == 'm':  # Next day
+            self.navigate_date('next')
+            self.current_selection = 0
+            self.load_tasks()
+            self._frame_dirty = True
+        elif key == '\x03':  # Ctrl+C
+            self.running = False
 
     def handle_edit_input(self):
         """Handle keyboard input in edit mode."""
-        import termios
-        import tty
+        self._dispatch_edit_key(read_key())
+
+    def _dispatch_edit_key(self, key):
+        """
+        Apply one edit mode keypress.
         
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.cbreak(fd)
-            key = sys.stdin.read(1)
-            
-            if key == '\x1b':  # Escape sequence or single escape
-                try:
-                    key += sys.stdin.read(2)
-                    if key == '\x1b[A':  # Up arrow
-                        if self.tasks:
-                            self.current_selection = (self.current_selection - 1) % len(self.tasks)
-                    elif key == '\x1b[B':  # Down arrow
-                        if self.tasks:
-                            self.current_selection = (self.current_selection + 1) % len(self.tasks)
-                except:
-                    # Single Esc - go back to view mode
-                    self.edit_mode = False
-            elif key == ' ':  # Space - toggle completion
-                if self.tasks and 0 <= self.current_selection < len(self.tasks):
-                    self.toggle_task_completion(self.current_selection)
-            elif key == '\t':  # Tab - indent task
-                if self.tasks and 0 <= self.current_selection < len(self.tasks):
-                    self.indent_task(self.current_selection)
-            elif key == '\x1b[Z':  # Shift+Tab - unindent task
-                if self.tasks and 0 <= self.current_selection < len(self.tasks):
-                    self.unindent_task(self.current_selection)
-            elif key == '\r' or key == '\n':  # Enter - edit task text
-                if self.tasks and 0 <= self.current_selection < len(self.tasks):
-                    self._edit_task_text()
-            elif key == '\x7f':  # Backspace/Delete - delete task
-                if self.tasks and 0 <= self.current_selection < len(self.tasks):
-                    self.delete_task(self.current_selection)
-            elif key == '\x03':  # Ctrl+C
-                self.running = False
-            elif ord(key) == 10:  # Ctrl+Enter - add new task
-                self._add_new_task()
-            elif ord(key) == 19:  # Ctrl+S - save
-                self.save_tasks()
+        Args:
+            key (str): Key as returned by read_key()
+        """
+        if key == '\x1b[A':  # Up arrow
+            if self.texts:
+                self.current_selection = (self.current_selection - 1) % len(self.texts)
+        elif key == '\x1b[B':  # Down arrow
+            if self.texts:
+                self.current_selection = (self.current_selection + 1) % len(self.texts)
+        elif key == '\x1b[Z':  # Shift+Tab - unindent task
+            if self.texts and 0 <= self.current_selection < len(self.texts):
+                self.unindent_task(self.current_selection)
+        elif key == '\x1b':  # Single Esc - go back to view mode
+            self.edit_mode = False
+        elif key.startswith('\x1b'):  # Other escape sequences are ignored
+            pass
+        elif key == ' ':  # Space - toggle completion
+            if self.texts and 0 <= self.current_selection < len(self.texts):
+                self.toggle_task_completion(self.current_selection)
+        elif key == '\t':  # Tab - indent task
+            if self.texts and 0 <= self.current_selection < len(self.texts):
+                self.indent_task(self.current_selection)
+        elif key == '\r' or key == '\n':  # Enter - edit task text
+            if self.texts and 0 <= self.current_selection < len(self.texts):
+                self._edit_task_text()
+        elif key == '\x7f':  # Backspace/Delete - delete task
+            if self.texts and 0 <= self.current_selection < len(self.texts):
+                self.delete_task(self.current_selection)
+        elif key == '\x03':  # Ctrl+C
+            self.running = False
+        elif ord(key) == 10:  # Ctrl+Enter - add new task
+            self._add_new_task()
+        elif ord(key) == 19:  # Ctrl+S - save
+            self.save_tasks()
+            self.flush_saves()
+            if not self._report_save_error():
                 self._show_message("✓ Tasks saved!")
-                
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
     def _show_message(self, message, wait_time=1.0):
         """Show a temporary message to user."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│              Message                │")
-        print("├─────────────────────────────────────┤")
-        print(f"│ {message[:35]:<35} │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│              Message                │",
+            "├─────────────────────────────────────┤",
+            f"│ {message[:35]:<35} │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         if wait_time > 0:
             time.sleep(wait_time)
 
+    def _report_save_error(self):
+        """
+        Show the last error from writing tasks, if any, and clear it.
+        
+        Returns:
+            bool: True if an error was shown
+        """
+        with self._save_lock:
+            error, self._save_error = self._save_error, None
+        if not error:
+            return False
+        
+        self._show_message(error)
+        self._frame_dirty = True
+        return True
+
     def load_tasks(self):
         """Load tasks from markdown file for current date."""
+        self._invalidate_lines()
+        with self._save_lock:
+            self._load_tasks()
+
+    def _load_tasks(self):
+        """Load tasks for the current date; the caller holds _save_lock."""
         vault_path = self.get_vault_path()
         if not vault_path:
-            self.tasks = []
+            self._clear_tasks()
             return
         
         tasks_dir = Path(vault_path) / "Tasks"
-        tasks_dir.mkdir(exist_ok=True)
+        self._ensure_tasks_dir(tasks_dir)
         
         filename = self.create_task_filename(self.current_date)
         filepath = tasks_dir / filename
         
-        if not filepath.exists():
-            self.tasks = []
+        # A save still waiting for the writer is newer than the file
+        pending = self._pending_saves.get(str(filepath))
+        if pending:
+            self._restore_tasks(pending[3])
             return
         
+        # Days without a task file are answered from the directory listing
+        if filename not in self._get_task_files(tasks_dir):
+            self._clear_tasks()
+            return
+        
+        # One stat answers both "does it exist" and "has it changed"
         try:
+            mtime = os.stat(filepath).st_mtime_ns
+        except FileNotFoundError:
+            self._clear_tasks()
+            return
+        
+        try:
+            # Reuse the parsed tasks if the file hasn't changed since
+            cache_key = str(filepath)
+            cached = self._task_cache.get(cache_key)
+            if cached and cached[0] == mtime:
+                self._task_cache.move_to_end(cache_key)
+                self._restore_tasks(cached[1:])
+                return
+            
             with open(filepath, 'r') as f:
                 content = f.read()
             
-            self.tasks = self.parse_markdown_tasks(content)
+            self.texts, self.completed, self.indent_levels = self.parse_markdown_tasks(content)
+            self._cache_tasks(cache_key, mtime, self._task_snapshot())
             
         except Exception as e:
             print(f"Error loading tasks: {e}")
-            self.tasks = []
+            self._clear_tasks()
 
     def get_vault_path(self):
         """Get the current vault path from settings."""
+        if self._vault_path_cache is not None:
+            return self._vault_path_cache
+        
         vault_path = self.settings.get_vault_path()
         
         # If no vault path found, try to load config
@@ -292,52 +564,207 @@ class Tasks:
             config = self.settings.load_config()
             vault_path = config.get('vault_path')
         
+        if vault_path:
+            self._vault_path_cache = vault_path
         return vault_path
 
     def save_tasks(self):
-        """Save tasks to markdown file."""
+        """
+        Save tasks to markdown file.
+        
+        The current tasks are snapshotted and written by a background thread,
+        which coalesces saves made in quick succession into one write. Use
+        flush_saves() to wait until everything is on disk.
+        """
         vault_path = self.get_vault_path()
         if not vault_path:
             return
         
         tasks_dir = Path(vault_path) / "Tasks"
-        tasks_dir.mkdir(exist_ok=True)
-        
         filename = self.create_task_filename(self.current_date)
         filepath = tasks_dir / filename
         
-        content = self.format_tasks_to_markdown()
+        snapshot = (tasks_dir, filename, self.format_tasks_to_markdown(), self._task_snapshot())
+        with self._save_lock:
+            self._pending_saves[str(filepath)] = snapshot
         
+        if self._save_thread is None:
+            self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+            self._save_thread.start()
+        self._save_queue.put(filename)
+
+    def flush_saves(self):
+        """Write all pending saves now instead of waiting for the background thread."""
+        with self._save_lock:
+            pending, self._pending_saves = self._pending_saves, {}
+            for snapshot in pending.values():
+                self._write_tasks(*snapshot)
+
+    def _stop_save_worker(self):
+        """Stop the background writer thread, if one was started, and wait for it."""
+        if self._save_thread is None:
+            return
+        
+        self._save_queue.put(None)
+        self._save_thread.join()
+        self._save_thread = None
+
+    def _save_worker(self):
+        """
+        Background thread writing queued saves, a coalesce window apart.
+        
+        Exits after its last flush once None is queued, see _stop_save_worker().
+        """
+        while True:
+            if self._save_queue.get() is None:
+                return
+            time.sleep(SAVE_COALESCE_DELAY)
+            
+            # Saves queued meanwhile are covered by the flush below
+            stop = False
+            try:
+                while True:
+                    if self._save_queue.get_nowait() is None:
+                        stop = True
+            except queue.Empty:
+                pass
+            
+            self.flush_saves()
+            if stop:
+                return
+
+    def _write_tasks(self, tasks_dir, filename, content, tasks):
+        """
+        Write one task file and update the caches; the caller holds _save_lock.
+        
+        Args:
+            tasks_dir (Path): Tasks directory of the vault
+            filename (str): Task file name
+            content (str): Markdown to write
+            tasks (tuple): Snapshot of the saved tasks, see _task_snapshot()
+        """
+        filepath = tasks_dir / filename
+        
+        # Write next to the file and swap it in, so a crash never leaves
+        # a half-written task list behind
+        tmp_path = filepath.with_suffix('.md.tmp')
         try:
-            with open(filepath, 'w') as f:
-                f.write(content)
+            self._ensure_tasks_dir(tasks_dir)
+            tmp_path.write_text(content)
+            os.replace(tmp_path, filepath)
+            mtime = os.stat(filepath).st_mtime_ns
+            self._get_task_files(tasks_dir).add(filename)
+            self._cache_tasks(str(filepath), mtime, tasks)
         except Exception as e:
-            print(f"Error saving tasks: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            self._save_error = f"❌ Error saving tasks: {e}"
+
+    def _ensure_tasks_dir(self, tasks_dir):
+        """
+        Create the Tasks directory once per session instead of on every load/save.
+        
+        Args:
+            tasks_dir (Path): Tasks directory of the vault
+        """
+        if tasks_dir != self._created_tasks_dir:
+            tasks_dir.mkdir(parents=True, exist_ok=True)
+            self._created_tasks_dir = tasks_dir
+
+    def _get_task_files(self, tasks_dir):
+        """
+        Get the names of the task files in a Tasks directory.
+        
+        The directory is scanned once and the set is kept up to date by
+        save_tasks(), so navigating through empty days needs no stat calls.
+        
+        Args:
+            tasks_dir (Path): Tasks directory of the vault
+            
+        Returns:
+            set: Task file names, e.g. "Task_2024-01-31.md"
+        """
+        if self._task_files is None or self._task_files_dir != tasks_dir:
+            try:
+                with os.scandir(tasks_dir) as entries:
+                    self._task_files = {
+                        entry.name for entry in entries
+                        if _TASK_FILE_RE.fullmatch(entry.name)
+                    }
+            except OSError:
+                self._task_files = set()
+            self._task_files_dir = tasks_dir
+        return self._task_files
+
+    def _cache_tasks(self, cache_key, mtime, tasks):
+        """
+        Remember the tasks of a task file, evicting the oldest entries.
+        
+        Args:
+            cache_key (str): Path of the task file
+            mtime (int): Modification time of the task file in nanoseconds
+            tasks (tuple): Snapshot of the tasks, see _task_snapshot()
+        """
+        self._task_cache[cache_key] = (mtime,) + tasks
+        self._task_cache.move_to_end(cache_key)
+        while len(self._task_cache) > TASK_CACHE_SIZE:
+            self._task_cache.popitem(last=False)
+
+    def _task_snapshot(self):
+        """
+        Take an immutable copy of the current tasks.
+        
+        Returns:
+            tuple: (texts tuple, completed bytes, indent_levels bytes)
+        """
+        return tuple(self.texts), bytes(self.completed), bytes(self.indent_levels)
+
+    def _restore_tasks(self, tasks):
+        """
+        Replace the current tasks with a copy of a snapshot.
+        
+        Args:
+            tasks (tuple): Texts, completed flags and indent levels, as
+                returned by _task_snapshot()
+        """
+        texts, completed, indent_levels = tasks
+        self.texts = list(texts)
+        self.completed = bytearray(completed)
+        self.indent_levels = bytearray(indent_levels)
+
+    def _clear_tasks(self):
+        """Replace the current tasks with an empty list."""
+        self.texts = []
+        self.completed = bytearray()
+        self.indent_levels = bytearray()
+        self._invalidate_lines()
 
     def _add_new_task(self):
         """Add a new task with user input."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│            ➕ Add Task               │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print("│ Enter task description:             │")
-        print("│                                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│            ➕ Add Task               │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            "│ Enter task description:             │",
+            "│                                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         try:
-            task_text = input("Task: ").strip()
+            with cooked_mode():
+                task_text = input("Task: ").strip()
             
             if task_text:
-                new_task = {
-                    'text': task_text,
-                    'completed': False,
-                    'indent_level': 0
-                }
-                self.tasks.append(new_task)
-                self.current_selection = len(self.tasks) - 1
+                self.texts.append(task_text)
+                self.completed.append(0)
+                self.indent_levels.append(0)
+                self.current_selection = len(self.texts) - 1
+                self._invalidate_lines(self.current_selection)
                 self._show_message(f"✓ Added task: {task_text[:20]}...")
             
         except (KeyboardInterrupt, EOFError):
@@ -345,29 +772,32 @@ class Tasks:
 
     def _edit_task_text(self):
         """Edit the text of the selected task."""
-        if not self.tasks or not (0 <= self.current_selection < len(self.tasks)):
+        if not self.texts or not (0 <= self.current_selection < len(self.texts)):
             return
         
-        current_task = self.tasks[self.current_selection]
-        
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│            ✏️ Edit Task              │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print(f"│ Current: {current_task['text'][:25]:<25} │")
-        print("│                                     │")
-        print("│ Enter new text:                     │")
-        print("│                                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        current_text = self.texts[self.current_selection]
+        
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│            ✏️ Edit Task              │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            f"│ Current: {current_text[:25]:<25} │",
+            "│                                     │",
+            "│ Enter new text:                     │",
+            "│                                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         try:
-            new_text = input("Task: ").strip()
+            with cooked_mode():
+                new_text = input("Task: ").strip()
             
             if new_text:
-                current_task['text'] = new_text
+                self.texts[self.current_selection] = new_text
+                self._invalidate_lines(self.current_selection)
                 self._show_message(f"✓ Updated task")
             
         except (KeyboardInterrupt, EOFError):
@@ -375,26 +805,28 @@ class Tasks:
 
     def _jump_to_date(self):
         """Allow user to jump to a specific date."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│            📅 Jump to Date           │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print("│ Enter date (YYYY-MM-DD):            │")
-        print("│ Or press Enter for today            │")
-        print("│                                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│            📅 Jump to Date           │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            "│ Enter date (YYYY-MM-DD):            │",
+            "│ Or press Enter for today            │",
+            "│                                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         try:
-            date_str = input("Date: ").strip()
+            with cooked_mode():
+                date_str = input("Date: ").strip()
             
             if not date_str:
-                self.current_date = datetime.now().date()
+                self._set_date(datetime.now().date())
             else:
                 try:
-                    self.current_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                    self._set_date(datetime.strptime(date_str, '%Y-%m-%d').date())
                 except ValueError:
                     self._show_message("❌ Invalid date format\nUse YYYY-MM-DD")
                     return
@@ -427,8 +859,9 @@ class Tasks:
         Args:
             task_index (int): Index of task to toggle
         """
-        if 0 <= task_index < len(self.tasks):
-            self.tasks[task_index]['completed'] = not self.tasks[task_index].get('completed', False)
+        if 0 <= task_index < len(self.texts):
+            self.completed[task_index] ^= 1
+            self._invalidate_lines(task_index)
 
     def indent_task(self, task_index):
         """
@@ -437,9 +870,9 @@ class Tasks:
         Args:
             task_index (int): Index of task to indent
         """
-        if 0 <= task_index < len(self.tasks):
-            current_level = self.tasks[task_index].get('indent_level', 0)
-            self.tasks[task_index]['indent_level'] = min(current_level + 1, 3)
+        if 0 <= task_index < len(self.texts):
+            self.indent_levels[task_index] = min(self.indent_levels[task_index] + 1, 3)
+            self._invalidate_lines(task_index)
 
     def unindent_task(self, task_index):
         """
@@ -448,9 +881,9 @@ class Tasks:
         Args:
             task_index (int): Index of task to unindent
         """
-        if 0 <= task_index < len(self.tasks):
-            current_level = self.tasks[task_index].get('indent_level', 0)
-            self.tasks[task_index]['indent_level'] = max(current_level - 1, 0)
+        if 0 <= task_index < len(self.texts):
+            self.indent_levels[task_index] = max(self.indent_levels[task_index] - 1, 0)
+            self._invalidate_lines(task_index)
 
     def delete_task(self, task_index):
         """
@@ -459,10 +892,13 @@ class Tasks:
         Args:
             task_index (int): Index of task to delete
         """
-        if 0 <= task_index < len(self.tasks):
-            del self.tasks[task_index]
-            if self.current_selection >= len(self.tasks) and self.tasks:
-                self.current_selection = len(self.tasks) - 1
+        if 0 <= task_index < len(self.texts):
+            del self.texts[task_index]
+            del self.completed[task_index]
+            del self.indent_levels[task_index]
+            self._invalidate_lines()
+            if self.current_selection >= len(self.texts) and self.texts:
+                self.current_selection = len(self.texts) - 1
 
     def jump_to_date(self):
         """Allow user to jump to a specific date."""
@@ -477,14 +913,19 @@ class Tasks:
             direction (str): 'prev' or 'next'
         """
         if direction == 'prev':
-            self.current_date -= timedelta(days=1)
+            self._set_date(self.current_date - timedelta(days=1))
         elif direction == 'next':
-            self.current_date += timedelta(days=1)
+            self._set_date(self.current_date + timedelta(days=1))
 
-    def get_vault_path(self):
-        """Get the current vault path from settings."""
-        # Placeholder for vault path retrieval
-        pass
+    def _set_date(self, date):
+        """
+        Switch the current date and refresh its cached display string.
+        
+        Args:
+            date (datetime.date): New current date
+        """
+        self._current_date = date
+        self._date_str = date.isoformat()
 
     def create_task_filename(self, date):
         """
@@ -500,50 +941,37 @@ class Tasks:
 
     def parse_markdown_tasks(self, content):
         """
-        Parse markdown content into task objects.
+        Parse markdown content into parallel task arrays.
         
         Args:
             content (str): Markdown file content
             
         Returns:
-            list: List of task dictionaries
+            tuple: (texts list, completed bytearray, indent_levels bytearray)
         """
-        tasks = []
-        lines = content.split('\n')
-        
-        for line in lines:
-            # Skip empty lines and headers
-            if not line.strip() or line.strip().startswith('#'):
+        texts = []
+        completed = bytearray()
+        indent_levels = bytearray()
+        
+        for line in content.split('\n'):
+            # Headers, blank lines and notes are rejected before the regex runs
+            stripped = line.lstrip(' \t')
+            if not stripped.startswith('- ['):
+                continue
+            
+            match = _TASK_RE.match(stripped)
+            if not match:
                 continue
             
-            # Look for task lines (- [ ] or - [x])
-            if '- [' in line and ']' in line:
-                # Calculate indent level (count leading spaces before -)
-                indent_level = 0
-                for char in line:
-                    if char == ' ':
-                        indent_level += 1
-                    elif char == '-':
-                        break
-                
-                # Convert to indent levels (4 spaces = 1 level)
-                indent_level = indent_level // 4
-                
-                # Extract completion status
-                completed = '[x]' in line.lower() or '[X]' in line
-                
-                # Extract task text (everything after the checkbox)
-                checkbox_end = line.find(']') + 1
-                task_text = line[checkbox_end:].strip()
-                
-                if task_text:
-                    tasks.append({
-                        'text': task_text,
-                        'completed': completed,
-                        'indent_level': indent_level
-                    })
-        
-        return tasks
+            task_text = match.group(2).strip()
+            if task_text:
+                texts.append(task_text)
+                completed.append(match.group(1) in ('x', 'X'))
+                # 4 columns per indent level, tabs count as a full level
+                indent = line[:len(line) - len(stripped)].expandtabs(4)
+                indent_levels.append(min(len(indent) // 4, _MAX_PARSED_INDENT))
+        
+        return texts, completed, indent_levels
 
     def format_tasks_to_markdown(self):
         """
@@ -552,20 +980,13 @@ class Tasks:
         Returns:
             str: Markdown formatted task list
         """
-        if not self.tasks:
-            return f"# Tasks - {self.current_date.strftime('%Y-%m-%d')}\n\n(No tasks for this date)\n"
+        if not self.texts:
+            return f"# Tasks - {self.current_date_str}\n\n(No tasks for this date)\n"
         
-        content = f"# Tasks - {self.current_date.strftime('%Y-%m-%d')}\n\n"
+        parts = [f"# Tasks - {self.current_date_str}\n\n"]
         
-        for task in self.tasks:
-            # Create indentation (4 spaces per level)
-            indent = "    " * task.get('indent_level', 0)
-            
-            # Create checkbox
-            checkbox = "[x]" if task.get('completed', False) else "[ ]"
-            
-            # Create task line
-            task_line = f"{indent}- {checkbox} {task.get('text', '')}\n"
-            content += task_line
+        for text, completed, indent_level in zip(self.texts, self.completed, self.indent_levels):
+            # 4 spaces of indentation per level
+            parts.append(f"{'    ' * indent_level}- {_CHECKBOXES[completed]} {text}\n")
         
-        return content
\ No newline at end of file
+        return ''.join(parts)
\ No newline at end of file
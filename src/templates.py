@@ -4,10 +4,54 @@ Handles creation and management of habit templates.
 """
 
 import os
-import sys
-import json
+import re
+import mmap
 import time
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+
+from .settings import Settings
+from .terminal import cbreak_mode, cooked_mode, read_key, write_frame
+
+# Field type by tag or keyword in a "## " heading, checked in order
+_FIELD_TYPE_HINTS = (
+    ('time', ('[time]', 'duration')),
+    ('pages', ('[pages]', 'page')),
+    ('mood', ('[mood]', 'rating')),
+    ('mcq', ('[mcq]', 'choice')),
+)
+
+# A "## " heading that _parse_template_fields() turns into a field; bytes so
+# it can scan a memory-mapped file without decoding it
+_FIELD_HEADING_RE = re.compile(rb'^[^\S\n]*## [^\S\n]*(?!Notes)\S', re.MULTILINE)
+
+# Type tags removed from a heading to get the field name
+_TAG_RE = re.compile(r'\[(?:time|pages|mood|mcq)\]', re.IGNORECASE)
+
+# posix_fadvise is missing on macOS and Windows
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Template count from which files are loaded on a thread pool, and its size;
+# below that the pool costs more than the reads it overlaps
+_PARALLEL_LOAD_MIN = 8
+_LOAD_WORKERS = 16
+
+# Heading suffix and value placeholder written for each field type
+_TYPE_SUFFIX = {'time': ' [time]', 'pages': ' [pages]', 'mood': ' [mood 1-10]', 'mcq': ' [mcq]'}
+_TYPE_BODY = {'mcq': '- [ ] Option 1\n- [ ] Option 2\n- [ ] Option 3\n'}
+_DEFAULT_BODY = '- [Enter value here]\n'
+
+# Field types a template can use; read-only so one shared copy can be handed out
+_FIELD_TYPES = (
+    MappingProxyType({'name': 'Time', 'type': 'time', 'description': 'Time duration with unit'}),
+    MappingProxyType({'name': 'Pages', 'type': 'pages', 'description': 'Page count with unit'}),
+    MappingProxyType({'name': 'Mood', 'type': 'mood', 'description': 'Mood scale 1-10'}),
+    MappingProxyType({'name': 'Notes', 'type': 'notes', 'description': 'Free text notes'}),
+    MappingProxyType({'name': 'MCQ', 'type': 'mcq', 'description': 'Multiple choice question'}),
+)
 
 
 class Templates:
@@ -16,54 +60,89 @@ class Templates:
     Allows creating, editing, and deleting habit templates.
     """
     
+    # Static frame pieces, built once instead of on every redraw
+    _SEPARATOR = "├─────────────────────────────────────┤"
+    _MENU_HEADER = (
+        "\033[32m",  # Green tint
+        "╭─────────────────────────────────────╮",
+        "│           📋 Template Manager        │",
+        _SEPARATOR,
+    )
+    _MENU_EMPTY = (
+        "│                                     │",
+        "│  No templates found.                │",
+        "│  Press C to create your first!      │",
+        "│                                     │",
+    )
+    _MENU_ROW = "│%s%-22s [%2d fields] │"
+    _MENU_FOOTER = (
+        _SEPARATOR,
+        "│ Enter: View template                │",
+        "│ C: Create template                  │",
+        "│ D: Delete template                  │",
+        "│ Esc: Back to dashboard              │",
+        "╰─────────────────────────────────────╯",
+        "\033[0m",
+    )
+    _INFO_FOOTER = (
+        _SEPARATOR,
+        "│ This template can be edited         │",
+        "│ externally in any text editor.      │",
+        "│                                     │",
+        "│ Press any key to continue...        │",
+        "╰─────────────────────────────────────╯",
+        "\033[0m",
+    )
+    
     def __init__(self):
         """Initialize Templates module."""
         self.templates = []
         self.current_selection = 0
         self.running = True
         self.edit_mode = False
+        
+        # Templates per lower-cased name, for duplicate checks; counted since
+        # files may differ only in case on case-sensitive filesystems
+        self._template_names = Counter()
+        
+        # Templates directory of the configured vault, looked up once per
+        # visit (the dashboard creates a new Templates for each one)
+        self._templates_dir = None
+        
+        # Templates directory already created (or found) this session
+        self._created_templates_dir = None
 
     def run(self):
         """Main Templates module loop."""
         self.load_templates()
-        while self.running:
-            if self.edit_mode:
-                self.display_edit_view()
-                self.handle_edit_input()
-            else:
-                self.display_menu()
-                self.handle_menu_input()
+        with cbreak_mode():
+            while self.running:
+                if self.edit_mode:
+                    self.display_edit_view()
+                    self.handle_edit_input()
+                else:
+                    self.display_menu()
+                    self.handle_menu_input()
 
     def display_menu(self):
         """Display templates main menu."""
-        os.system('clear')
-        print("\033[32m")  # Green tint
-        print("╭─────────────────────────────────────╮")
-        print("│           📋 Template Manager        │")
-        print("├─────────────────────────────────────┤")
+        lines = list(self._MENU_HEADER)
         
         if not self.templates:
-            print("│                                     │")
-            print("│  No templates found.                │")
-            print("│  Press C to create your first!      │")
-            print("│                                     │")
+            lines.extend(self._MENU_EMPTY)
         else:
-            print(f"│ Found {len(self.templates)} template(s):                  │")
-            print("├─────────────────────────────────────┤")
+            lines.append(f"│ Found {len(self.templates)} template(s):                  │")
+            lines.append(self._SEPARATOR)
             
-            for i, template in enumerate(self.templates):
-                prefix = "► " if i == self.current_selection else "  "
-                name = template.get('name', 'Unnamed')[:20]
-                field_count = len(template.get('fields', []))
-                print(f"│{prefix}{name:<22} [{field_count:>2} fields] │")
-        
-        print("├─────────────────────────────────────┤")
-        print("│ Enter: View template                │")
-        print("│ C: Create template                  │")
-        print("│ D: Delete template                  │")
-        print("│ Esc: Back to dashboard              │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+            selection = self.current_selection
+            row = self._MENU_ROW
+            lines.extend([
+                row % ("► " if i == selection else "  ", template['name'][:20], self._field_count(template))
+                for i, template in enumerate(self.templates)
+            ])
+        
+        lines.extend(self._MENU_FOOTER)
+        write_frame(lines)
 
     def display_edit_view(self):
         """Display template editor."""
@@ -72,41 +151,28 @@ class Templates:
 
     def handle_menu_input(self):
         """Handle keyboard input for templates menu."""
-        import termios
-        import tty
-        
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.cbreak(fd)
-            key = sys.stdin.read(1)
-            
-            if key == '\x1b':  # Escape sequence or single escape
-                try:
-                    key += sys.stdin.read(2)
-                    if key == '\x1b[A':  # Up arrow
-                        if self.templates:
-                            self.current_selection = (self.current_selection - 1) % len(self.templates)
-                    elif key == '\x1b[B':  # Down arrow
-                        if self.templates:
-                            self.current_selection = (self.current_selection + 1) % len(self.templates)
-                except:
-                    # Single Esc - go back
-                    self.running = False
-            elif key == '\r' or key == '\n':  # Enter - edit template
-                if self.templates:
-                    self._show_template_info()
-            elif key.lower() == 'c':  # Create template
-                self.create_template()
-                self.load_templates()  # Reload
-            elif key.lower() == 'd':  # Delete template
-                if self.templates:
-                    self._delete_template()
-            elif key == '\x03':  # Ctrl+C
-                self.running = False
-                
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        key = read_key()
+        
+        if key == '\x1b[A':  # Up arrow
+            if self.templates:
+                self.current_selection = (self.current_selection - 1) % len(self.templates)
+        elif key == '\x1b[B':  # Down arrow
+            if self.templates:
+                self.current_selection = (self.current_selection + 1) % len(self.templates)
+        elif key == '\x1b':  # Single Esc - go back
+            self.running = False
+        elif key.startswith('\x1b'):  # Other escape sequences are ignored
+            pass
+        elif key == '\r' or key == '\n':  # Enter - edit template
+            if self.templates:
+                self._show_template_info()
+        elif key.lower() == 'c':  # Create template
+            self.create_template()
+        elif key.lower() == 'd':  # Delete template
+            if self.templates:
+                self._delete_template()
+        elif key == '\x03':  # Ctrl+C
+            self.running = False
 
     def _show_template_info(self):
         """Show detailed information about selected template."""
@@ -114,42 +180,31 @@ class Templates:
             return
         
         template = self.templates[self.current_selection]
+        fields = self._get_fields(template)
+        
+        lines = [
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            f"│ 📋 Template: {template['name'][:20]:<20} │",
+            self._SEPARATOR,
+            f"│ File: {template['filename'][:28]:<28} │",
+            f"│ Fields: {len(fields)}                          │",
+            self._SEPARATOR,
+        ]
         
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print(f"│ 📋 Template: {template['name'][:20]:<20} │")
-        print("├─────────────────────────────────────┤")
-        print(f"│ File: {template['filename'][:28]:<28} │")
-        print(f"│ Fields: {len(template.get('fields', []))}                          │")
-        print("├─────────────────────────────────────┤")
-        
-        for field in template.get('fields', [])[:6]:  # Show first 6 fields
+        for field in fields[:6]:  # Show first 6 fields
             field_name = field['name'][:20]
             field_type = field['type']
-            print(f"│ • {field_name:<20} [{field_type:<8}] │")
+            lines.append(f"│ • {field_name:<20} [{field_type:<8}] │")
         
-        if len(template.get('fields', [])) > 6:
-            print(f"│ ... and {len(template['fields']) - 6} more fields            │")
+        if len(fields) > 6:
+            lines.append(f"│ ... and {len(fields) - 6} more fields            │")
         
-        print("├─────────────────────────────────────┤")
-        print("│ This template can be edited         │")
-        print("│ externally in any text editor.      │")
-        print("│                                     │")
-        print("│ Press any key to continue...        │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        lines.extend(self._INFO_FOOTER)
+        write_frame(lines)
         
         # Wait for keypress
-        import termios
-        import tty
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.cbreak(fd)
-            sys.stdin.read(1)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        read_key()
 
     def _delete_template(self):
         """Delete selected template with confirmation."""
@@ -158,95 +213,101 @@ class Templates:
         
         template = self.templates[self.current_selection]
         
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│            ⚠️ Delete Template        │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print(f"│ Delete '{template['name'][:22]}'?             │")
-        print("│                                     │")
-        print("│ This cannot be undone!              │")
-        print("│                                     │")
-        print("│ Y - Yes, delete    N - Cancel       │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
-        
-        import termios
-        import tty
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.cbreak(fd)
-            key = sys.stdin.read(1).lower()
-            
-            if key == 'y':
-                # Delete file
-                vault_path = self.get_vault_path()
-                if vault_path:
-                    templates_dir = Path(vault_path) / "Templates" / "Habits"
-                    filepath = templates_dir / template['filename']
-                    
-                    try:
-                        filepath.unlink()
-                        self.templates.pop(self.current_selection)
-                        if self.current_selection >= len(self.templates) and self.templates:
-                            self.current_selection = len(self.templates) - 1
-                        self._show_message(f"✓ Deleted {template['name']}")
-                    except Exception as e:
-                        self._show_message(f"❌ Error deleting: {e}")
-                else:
-                    self._show_message("❌ No vault configured")
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│            ⚠️ Delete Template        │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            f"│ Delete '{template['name'][:22]}'?             │",
+            "│                                     │",
+            "│ This cannot be undone!              │",
+            "│                                     │",
+            "│ Y - Yes, delete    N - Cancel       │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
+        
+        key = read_key().lower()
+        
+        if key == 'y':
+            # Delete file
+            templates_dir = self.get_templates_path()
+            if templates_dir:
+                filepath = templates_dir / template['filename']
+                
+                try:
+                    filepath.unlink()
+                    self.templates.pop(self.current_selection)
+                    name = template['name'].lower()
+                    self._template_names[name] -= 1
+                    if self._template_names[name] <= 0:
+                        del self._template_names[name]
+                    if self.current_selection >= len(self.templates) and self.templates:
+                        self.current_selection = len(self.templates) - 1
+                    self._show_message(f"✓ Deleted {template['name']}")
+                except Exception as e:
+                    self._show_message(f"❌ Error deleting: {e}")
+            else:
+                self._show_message("❌ No vault configured")
 
     def handle_edit_input(self):
         """Handle keyboard input in template editor."""
-        import termios
-        import tty
+        key = read_key()
         
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.cbreak(fd)
-            key = sys.stdin.read(1)
-            
-            if key == '\x1b':  # Escape - go back to menu
-                self.edit_mode = False
-            elif key == '\x03':  # Ctrl+C
-                self.running = False
-            # Add other keys later
-                
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        if key == '\x1b':  # Escape - go back to menu
+            self.edit_mode = False
+        elif key == '\x03':  # Ctrl+C
+            self.running = False
+        # Add other keys later
 
     def load_templates(self):
         """Load templates from templates directory."""
-        vault_path = self.get_vault_path()
-        if not vault_path:
+        templates_dir = self.get_templates_path()
+        if not templates_dir:
             self.templates = []
+            self._template_names = Counter()
             return
         
-        templates_dir = Path(vault_path) / "Templates" / "Habits"
         if not templates_dir.exists():
-            templates_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_templates_dir(templates_dir)
             self.templates = []
+            self._template_names = Counter()
             return
         
         self.templates = []
-        for template_file in templates_dir.glob("*.template.md"):
-            try:
-                template_data = self._load_template_file(template_file)
-                if template_data:
-                    self.templates.append(template_data)
-            except Exception as e:
-                print(f"Error loading template {template_file.name}: {e}")
+        failed = []
+        try:
+            # One directory listing; the suffix is filtered on the names it returns
+            with os.scandir(templates_dir) as entries:
+                template_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(".template.md") and entry.is_file()
+                ]
+            
+            if len(template_files) >= _PARALLEL_LOAD_MIN:
+                workers = min(_LOAD_WORKERS, len(template_files))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    loaded = list(pool.map(self._try_load_template_file, template_files))
+            else:
+                loaded = [self._try_load_template_file(f) for f in template_files]
+            
+            for template_file, template in zip(template_files, loaded):
+                if template is None:
+                    failed.append(template_file.name)
+                else:
+                    self.templates.append(template)
+        except OSError as e:
+            print(f"Error loading templates: {e}")
         
-        self.templates.sort(key=lambda x: x.get('name', ''))
+        if failed:
+            print(f"Error loading templates: {', '.join(failed)}")
+        
+        self.templates.sort(key=lambda x: x['name'])
+        self._template_names = Counter(template['name'].lower() for template in self.templates)
 
     def get_vault_path(self):
         """Get the current vault path from settings."""
-        from .settings import Settings
         settings = Settings()
         vault_path = settings.get_vault_path()
         
@@ -256,55 +317,146 @@ class Templates:
         
         return vault_path
 
-    def _load_template_file(self, filepath):
-        """Load a single template file."""
+    def _try_load_template_file(self, filepath):
+        """
+        Load a single template file, reporting failure instead of raising.
+        
+        Args:
+            filepath (Path): Template file
+            
+        Returns:
+            dict: Template data, or None if the file couldn't be read
+        """
         try:
-            with open(filepath, 'r') as f:
-                content = f.read()
+            return self._load_template_file(filepath)
+        except (OSError, ValueError):
+            return None
+
+    def _load_template_file(self, filepath):
+        """
+        Load a single template file.
+        
+        Only the field headings are counted here, straight from a memory map
+        so long note bodies are never copied; the fields themselves are parsed
+        by _get_fields() when a template is first viewed or used.
+        
+        Args:
+            filepath (Path): Template file, known to exist
+            
+        Returns:
+            dict: Template data
+            
+        Raises:
+            OSError: If the file can't be read
+            UnicodeDecodeError: If the file isn't valid UTF-8
+        """
+        with open(filepath, 'rb') as f:
+            # Empty files can't be mapped and have no fields anyway
+            if os.fstat(f.fileno()).st_size == 0:
+                field_count = 0
+            else:
+                # The whole file is scanned front to back; on a cold cache
+                # this gets it read ahead in larger chunks
+                if _HAS_FADVISE:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    # Decoded once to reject files _get_fields() couldn't read,
+                    # so the menu never counts fields the info screen can't show
+                    str(mapped, 'utf-8')
+                    field_count = sum(1 for _ in _FIELD_HEADING_RE.finditer(mapped))
+        
+        return self._template_entry(filepath, field_count)
+
+    def _template_entry(self, filepath, field_count):
+        """
+        Build the template data kept in self.templates for a template file.
+        
+        Args:
+            filepath (Path): Template file
+            field_count (int): Number of fields, which are parsed later
             
-            # Parse template metadata from markdown
-            lines = content.split('\n')
-            template_name = filepath.stem.replace('.template', '')
+        Returns:
+            dict: Template data
+        """
+        template_name = filepath.stem.replace('.template', '')
+        
+        return {
+            'name': template_name,
+            'filename': filepath.name,
+            'path': filepath,
+            'fields': None,
+            'field_count': field_count
+        }
+
+    def _get_fields(self, template):
+        """
+        Get the fields of a template, parsing its file on first use.
+        
+        Args:
+            template (dict): Template data
             
-            template_data = {
-                'name': template_name,
-                'filename': filepath.name,
-                'fields': self._parse_template_fields(content)
-            }
+        Returns:
+            list: Field dictionaries, empty if the file can't be read
+        """
+        fields = template['fields']
+        if fields is None:
+            try:
+                with open(template['path'], 'r') as f:
+                    fields = self._parse_template_fields(f.read().split('\n'))
+            except (OSError, UnicodeDecodeError):
+                fields = []
+            template['fields'] = fields
+        return fields
+
+    def _field_count(self, template):
+        """
+        Get the number of fields of a template without parsing them.
+        
+        Args:
+            template (dict): Template data
             
-            return template_data
-        except Exception:
-            return None
+        Returns:
+            int: Number of fields
+        """
+        fields = template['fields']
+        return template['field_count'] if fields is None else len(fields)
 
-    def _parse_template_fields(self, content):
-        """Parse field definitions from template content."""
+    def _parse_template_fields(self, lines):
+        """
+        Parse field definitions from template content.
+        
+        Args:
+            lines (list): Lines of the template file
+            
+        Returns:
+            list: Field dictionaries
+        """
         fields = []
-        lines = content.split('\n')
         
-        current_field = None
         for line in lines:
             line = line.strip()
-            if line.startswith('## ') and not line.startswith('## Notes'):
-                # New field
-                field_name = line[3:].strip()
-                field_type = 'text'  # default
-                
-                # Detect field type from name
-                if '[time]' in field_name.lower() or 'duration' in field_name.lower():
-                    field_type = 'time'
-                elif '[pages]' in field_name.lower() or 'page' in field_name.lower():
-                    field_type = 'pages'
-                elif '[mood]' in field_name.lower() or 'rating' in field_name.lower():
-                    field_type = 'mood'
-                elif '[mcq]' in field_name.lower() or 'choice' in field_name.lower():
-                    field_type = 'mcq'
-                
-                current_field = {
-                    'name': field_name.replace('[time]', '').replace('[pages]', '').replace('[mood]', '').replace('[mcq]', '').strip(),
-                    'type': field_type,
-                    'required': True
-                }
-                fields.append(current_field)
+            if not line.startswith('## '):
+                continue
+            
+            # New field, unless it's the free-form notes section
+            field_name = line[3:].strip()
+            if field_name.startswith('Notes'):
+                continue
+            
+            # Detect field type from name, lower-casing it only once
+            lowered = field_name.lower()
+            field_type = 'text'  # default
+            for hint_type, hints in _FIELD_TYPE_HINTS:
+                if any(hint in lowered for hint in hints):
+                    field_type = hint_type
+                    break
+            
+            fields.append({
+                'name': _TAG_RE.sub('', field_name).strip(),
+                'type': field_type,
+                'required': True
+            })
         
         return fields
 
@@ -320,27 +472,29 @@ class Templates:
 
     def create_template(self):
         """Create a new habit template."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│        📝 Create Template            │")
-        print("├─────────────────────────────────────┤")
-        print("│                                     │")
-        print("│ Enter template name:                │")
-        print("│ (e.g., Reading, Exercise, Meditate) │")
-        print("│                                     │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│        📝 Create Template            │",
+            "├─────────────────────────────────────┤",
+            "│                                     │",
+            "│ Enter template name:                │",
+            "│ (e.g., Reading, Exercise, Meditate) │",
+            "│                                     │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         try:
-            template_name = input("Template name: ").strip()
+            with cooked_mode():
+                template_name = input("Template name: ").strip()
             
             if not template_name:
                 self._show_message("❌ Template name cannot be empty")
                 return
             
             # Check if template exists
-            if any(t['name'].lower() == template_name.lower() for t in self.templates):
+            if template_name.lower() in self._template_names:
                 self._show_message(f"❌ Template '{template_name}' already exists")
                 return
             
@@ -349,8 +503,18 @@ class Templates:
             
             # Save template
             if self._save_template_to_file(template_data):
-                self.templates.append(template_data)
-                self.templates.sort(key=lambda x: x.get('name', ''))
+                # Insert it as load_templates() would see it (Notes isn't a
+                # field there), in name order instead of re-sorting the list
+                field_count = sum(
+                    1 for field in template_data['fields']
+                    if not field['name'].startswith('Notes')
+                )
+                template = self._template_entry(
+                    self.get_templates_path() / template_data['filename'], field_count
+                )
+                names = [t['name'] for t in self.templates]
+                self.templates.insert(bisect_right(names, template['name']), template)
+                self._template_names[template['name'].lower()] += 1
                 self._show_message(f"✓ Created template: {template_name}")
             else:
                 self._show_message("❌ Failed to create template")
@@ -360,70 +524,70 @@ class Templates:
 
     def _save_template_to_file(self, template_data):
         """Save template data to markdown file."""
-        vault_path = self.get_vault_path()
-        if not vault_path:
+        templates_dir = self.get_templates_path()
+        if not templates_dir:
             return False
         
-        templates_dir = Path(vault_path) / "Templates" / "Habits"
-        templates_dir.mkdir(parents=True, exist_ok=True)
-        
         filename = self.template_filename(template_data['name'])
         filepath = templates_dir / filename
         
         content = self._generate_template_content(template_data)
         
+        # Write next to the file and swap it in, so a crash never leaves
+        # a half-written template behind
+        tmp_path = filepath.with_suffix('.md.tmp')
         try:
-            with open(filepath, 'w') as f:
+            self._ensure_templates_dir(templates_dir)
+            with open(tmp_path, 'w') as f:
                 f.write(content)
+            os.replace(tmp_path, filepath)
+            template_data['filename'] = filename
             return True
         except Exception as e:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             print(f"Error saving template: {e}")
             return False
 
+    def _ensure_templates_dir(self, templates_dir):
+        """
+        Create the templates directory once per session instead of on every save.
+        
+        Args:
+            templates_dir (Path): Habit templates directory of the vault
+        """
+        if templates_dir != self._created_templates_dir:
+            templates_dir.mkdir(parents=True, exist_ok=True)
+            self._created_templates_dir = templates_dir
+
     def _generate_template_content(self, template_data):
         """Generate markdown content for template."""
-        content = f"""# Template: {template_data['name']}
-
-This template defines the structure for {template_data['name']} habit logs.
-
-"""
+        name = template_data['name']
+        parts = [f"# Template: {name}\n\nThis template defines the structure for {name} habit logs.\n\n"]
         
-        for field in template_data.get('fields', []):
-            field_name = field['name']
+        for field in self._get_fields(template_data):
             field_type = field['type']
-            
-            if field_type == 'time':
-                field_name += " [time]"
-            elif field_type == 'pages':
-                field_name += " [pages]"
-            elif field_type == 'mood':
-                field_name += " [mood 1-10]"
-            elif field_type == 'mcq':
-                field_name += " [mcq]"
-            
-            content += f"## {field_name}\n"
-            
-            if field_type == 'mcq':
-                content += "- [ ] Option 1\n- [ ] Option 2\n- [ ] Option 3\n"
-            else:
-                content += "- [Enter value here]\n"
-            
-            content += "\n"
+            parts.append(f"## {field['name']}{_TYPE_SUFFIX.get(field_type, '')}\n")
+            parts.append(_TYPE_BODY.get(field_type, _DEFAULT_BODY))
+            parts.append("\n")
         
-        content += "## Notes\n- [Additional notes and reflections]\n"
+        parts.append("## Notes\n- [Additional notes and reflections]\n")
         
-        return content
+        return ''.join(parts)
 
     def _show_message(self, message, wait_time=1.5):
         """Show a temporary message to user."""
-        os.system('clear')
-        print("\033[32m")
-        print("╭─────────────────────────────────────╮")
-        print("│              Message                │")
-        print("├─────────────────────────────────────┤")
-        print(f"│ {message[:35]:<35} │")
-        print("╰─────────────────────────────────────╯")
-        print("\033[0m")
+        write_frame([
+            "\033[32m",
+            "╭─────────────────────────────────────╮",
+            "│              Message                │",
+            "├─────────────────────────────────────┤",
+            f"│ {message[:35]:<35} │",
+            "╰─────────────────────────────────────╯",
+            "\033[0m",
+        ])
         
         if wait_time > 0:
             time.sleep(wait_time)
@@ -485,15 +649,9 @@ This template defines the structure for {template_data['name']} habit logs.
         Get available field types for templates.
         
         Returns:
-            list: Available field types
-        """
-        return [
-            {'name': 'Time', 'type': 'time', 'description': 'Time duration with unit'},
-            {'name': 'Pages', 'type': 'pages', 'description': 'Page count with unit'},
-            {'name': 'Mood', 'type': 'mood', 'description': 'Mood scale 1-10'},
-            {'name': 'Notes', 'type': 'notes', 'description': 'Free text notes'},
-            {'name': 'MCQ', 'type': 'mcq', 'description': 'Multiple choice question'}
-        ]
+            tuple: Available field types as read-only mappings
+        """
+        return _FIELD_TYPES
 
     def create_default_template(self, name):
         """
@@ -523,15 +681,14 @@ This template defines the structure for {template_data['name']} habit logs.
             ]
         }
 
-    def get_vault_path(self):
-        """Get the current vault path from settings."""
-        # Placeholder for vault path retrieval
-        pass
-
     def get_templates_path(self):
         """Get the templates directory path."""
-        vault_path = self.get_vault_path()
-        return Path(vault_path) / "Templates" / "Habits" if vault_path else None
+        # Left unset without a vault, so one configured later is picked up
+        if self._templates_dir is None:
+            vault_path = self.get_vault_path()
+            if vault_path:
+                self._templates_dir = Path(vault_path) / "Templates" / "Habits"
+        return self._templates_dir
 
     def template_filename(self, template_name):
         """
@@ -0,0 +1,134 @@
+"""
+Terminal module for Bamboo Productivity app.
+Handles low-level screen output and keyboard modes shared by the module views.
+"""
+
+import os
+import sys
+import termios
+import tty
+from contextlib import contextmanager
+
+# Terminal attributes saved by the outermost cbreak_mode() block
+_saved_attrs = None
+
+# Cursor home + erase display; replaces spawning `clear` for each redraw
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+# Bytes requested per read; a paste burst arrives in as few reads as possible
+READ_SIZE = 16
+
+# Keys read but not yet handed out by read_key(); dropped when the outermost
+# cbreak_mode() block ends so they don't leak into the next screen
+_pending_keys = ""
+
+
+def write_frame(lines):
+    """
+    Clear the screen and draw a full frame with one write and one flush.
+
+    Args:
+        lines (list): Lines of the frame, without trailing newlines
+    """
+    sys.stdout.write(CLEAR_SCREEN + "\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def read_key():
+    """
+    Read one keypress, including any escape sequence.
+
+    Arrow keys arrive as one multi-byte burst, so a single os.read() on the
+    raw descriptor returns the whole sequence, and a bare Esc returns on
+    its own instead of blocking for follow-up bytes. When one read returns
+    several keys (typing ahead, pasting) the rest are kept and handed out
+    by the following calls without touching the descriptor.
+
+    Returns:
+        str: The key, e.g. 'a', '\x1b' for Esc or '\x1b[A' for Up (also
+            when the terminal sends '\x1bOA' in application cursor mode);
+            empty at end of input
+    """
+    global _pending_keys
+    if not _pending_keys:
+        data = os.read(sys.stdin.fileno(), READ_SIZE)
+        _pending_keys = data.decode('utf-8', errors='replace')
+    
+    end = _key_length(_pending_keys)
+    key, _pending_keys = _pending_keys[:end], _pending_keys[end:]
+    if len(key) == 3 and key.startswith('\x1bO'):
+        key = '\x1b[' + key[2]
+    return key
+
+
+def _key_length(keys):
+    """
+    Find the length of the first key in a string of buffered input.
+
+    Args:
+        keys (str): Buffered input
+
+    Returns:
+        int: 1 for a plain key or bare Esc, 3 for an SS3 sequence such as
+            '\x1bOA', 2 for Alt+key, the full length of a CSI sequence
+            such as '\x1b[A' or '\x1b[3~'
+    """
+    if not keys.startswith('\x1b') or len(keys) == 1 or keys[1] == '\x1b':
+        return 1
+    if keys[1] == 'O':
+        return min(3, len(keys))
+    if keys[1] != '[':
+        return 2
+    
+    # Parameter bytes up to and including the final byte (@ to ~)
+    for i in range(2, len(keys)):
+        if '@' <= keys[i] <= '~':
+            return i + 1
+    return len(keys)
+
+
+@contextmanager
+def cbreak_mode():
+    """
+    Put stdin into cbreak mode for the duration of the block.
+
+    Nested blocks reuse the outermost session, so wrapping a whole input
+    loop costs one tcgetattr/tcsetattr pair instead of one per keypress.
+    """
+    global _saved_attrs, _pending_keys
+    if _saved_attrs is not None:
+        yield
+        return
+
+    fd = sys.stdin.fileno()
+    _saved_attrs = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, _saved_attrs)
+        _saved_attrs = None
+        _pending_keys = ""
+
+
+@contextmanager
+def cooked_mode():
+    """
+    Temporarily restore line-buffered, echoing input inside cbreak_mode().
+
+    Used around input() prompts so typed text is visible and editable.
+    Keys read_key() had buffered are dropped: they can't be handed to
+    input(), and running them as commands after the prompt would be wrong.
+    """
+    global _pending_keys
+    _pending_keys = ""
+    if _saved_attrs is None:
+        yield
+        return
+
+    fd = sys.stdin.fileno()
+    termios.tcsetattr(fd, termios.TCSADRAIN, _saved_attrs)
+    try:
+        yield
+    finally:
+        tty.setcbreak(fd, termios.TCSADRAIN)